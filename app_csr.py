@@ -74,6 +74,15 @@ database_path = os.path.join(os.path.dirname(__file__),
                                 'data','movieapi.sqlite')
 app.config['SQLALCHEMY_DATABASE_URI'] = \
                                 f'sqlite:///{database_path}'
+# Size the connection pool for concurrent requests so workers
+# reuse warm connections (with their PRAGMAs already applied)
+# instead of re-opening the database file per request
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 10,
+    'max_overflow': 5,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+}
 
 db.init_app(app)
 data_manager = DataManagerSQLite(app, db)
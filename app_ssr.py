@@ -43,7 +43,7 @@ App Key Features:
 import os
 import logging
 import webbrowser
-from flask import Flask, request, render_template
+from flask import Flask, request, render_template, make_response
 from data_models import db, User, Movie
 from datamanager.data_manager_sqlite import DataManagerSQLite
 from omdb_data_fetcher import get_new_movie_data as data_fetcher
@@ -59,7 +59,9 @@ from omdb_data_fetcher import get_new_movie_data as data_fetcher
 # - Create the database and tables if they don't exist.........[√]
 
 app = Flask(__name__, static_folder='_static')
-logging.basicConfig(level=logging.INFO,
+# The log level can be raised (e.g. LOG_LEVEL=WARNING) in
+# production so INFO records are skipped entirely
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'),
     format='%(asctime)s %(levelname)s: %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S',
     filename='my_log_file_ssr.log')
@@ -68,6 +70,15 @@ database_path = os.path.join(os.path.dirname(__file__),
                                 'data','moviewebapp.sqlite')
 app.config['SQLALCHEMY_DATABASE_URI'] = \
                                 f'sqlite:///{database_path}'
+# Size the connection pool for concurrent requests so workers
+# reuse warm connections (with their PRAGMAs already applied)
+# instead of re-opening the database file per request
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 10,
+    'max_overflow': 5,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+}
 
 db.init_app(app)
 data_manager = DataManagerSQLite(app, db)
@@ -115,7 +126,10 @@ def home():
     app.logger.info("Home page accessed")
     message = "Welcome to the Movie Web App!"
 
-    movies = data_manager.get_all_movies()
+    # The poster grid only needs the id and poster URL, so only
+    # those two columns are fetched
+    movies = data_manager.get_all_movies(
+        columns=[Movie.movie_id, Movie.poster_url])
 
     return render_template('home.html',
                            message=message,
@@ -163,7 +177,7 @@ def list_user_movies(user_id):
     If no movies are found for the user, it renders the template
     with a message indicating that no movies were found.
     """
-    app.logger.info(f"List of movies for user {user_id} accessed")
+    app.logger.info("List of movies for user %s accessed", user_id)
     user_movies = data_manager.get_user_movies(user_id)
     user_name = data_manager.get_user_name(user_id)
 
@@ -257,7 +271,7 @@ def add_movie(user_id):
         the flask app from crashing when the route is not found.
     """
     if request.method == 'POST':
-        app.logger.info("POST request to add a new movie by {user_id}")
+        app.logger.info("POST request to add a new movie by %s", user_id)
 
         movie_name = request.form.get('movie_name')
         new_movie_obj = data_fetcher(movie_name)
@@ -317,8 +331,8 @@ def update_movie(user_id, movie_id):
         either the movie was updated successfully or not found.
     """
     if request.method == "POST":
-        app.logger.info("POST request to update movie details"
-                        "by {user_id} for movie {movie_id}")
+        app.logger.info("POST request to update movie details "
+                        "by %s for movie %s", user_id, movie_id)
 
         movie_to_update = data_manager.get_movie(movie_id)
         if movie_to_update:
@@ -362,12 +376,12 @@ def delete_movie(user_id, movie_id):
     * Only registered users can delete movies from the database
     """
     if request.method == "POST":
-        app.logger.info("POST request to delete movie"
-                        "by {user_id} for movie {movie_id}")
+        app.logger.info("POST request to delete movie "
+                        "by %s for movie %s", user_id, movie_id)
         deleted_movie = data_manager.delete_movie(user_id, movie_id)
         if deleted_movie:
             status = "Movie deleted"
-            message = f"Movie {deleted_movie.movie_name} deleted successfully!"
+            message = f"Movie {deleted_movie} deleted successfully!"
             app.logger.info(message)
             return render_template('redirect.html',
                                    status=status,
@@ -395,15 +409,31 @@ def delete_movie(user_id, movie_id):
 def movie_details(movie_id):
     """
     Returns the details of a specific movie.
+
+    The response carries a weak ETag derived from the movie's
+    updated_at timestamp, so repeat visits with a matching
+    If-None-Match header get a 304 Not Modified instead of a
+    full render. The ETag changes automatically whenever the
+    movie is updated.
     """
-    app.logger.info(f"Movie details for movie {movie_id} accessed")
+    app.logger.info("Movie details for movie %s accessed", movie_id)
     try:
         movie = data_manager.get_movie(movie_id)
         if movie:
-            return render_template('movie_info.html',
-                                    movie=movie), 200
+            response = make_response(
+                render_template('movie_info.html', movie=movie), 200)
+            if movie.updated_at:
+                response.set_etag(
+                    f"{movie.movie_id}-"
+                    f"{int(movie.updated_at.timestamp())}",
+                    weak=True)
+                response.last_modified = movie.updated_at
+            response.cache_control.public = True
+            response.cache_control.max_age = 60
+            response.cache_control.must_revalidate = True
+            return response.make_conditional(request)
     except Exception as e:
-        app.logger.error(f"Error fetching movie: {e}")
+        app.logger.error("Error fetching movie: %s", e)
         return render_template('redirect.html',
                                status='Error 500',
                                message=e), 500
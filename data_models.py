@@ -56,19 +56,30 @@ class Movie(db.Model): # pylint: disable=too-few-public-methods
         year (int): The release year of the movie.
         genre (str): The genre of the movie.
         poster_url (str): The URL of the movie poster.
+        updated_at (datetime): When the movie was last modified,
+        used for HTTP caching (ETag/Last-Modified).
     """
     __tablename__ = 'movies'
     movie_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    movie_name = db.Column(db.String, nullable=False)
+    # movie_name is unique so add_movie can rely on
+    # INSERT ... ON CONFLICT instead of a prior SELECT
+    movie_name = db.Column(db.String, nullable=False, unique=True)
     rating = db.Column(db.Float)
     year = db.Column(db.Integer)
     director = db.Column(db.String)
     genre = db.Column(db.String)
     poster_url = db.Column(db.String)
     plot = db.Column(db.String)
+    updated_at = db.Column(db.DateTime, default=db.func.now(),
+                           onupdate=db.func.now())
 
-    # Establish relationship with UserMovies table
-    user_movies = db.relationship('UserMovie', backref='movie_relation')
+    # Establish relationship with UserMovies table.
+    # The backref loads with "selectin" so code that reads
+    # movie_relation off a batch of UserMovie rows issues one
+    # IN query instead of one SELECT per row.
+    user_movies = db.relationship(
+        'UserMovie',
+        backref=db.backref('movie_relation', lazy='selectin'))
 
     def __str__(self):
         return (f"Movie ID: {self.movie_id}, "
@@ -90,6 +101,7 @@ class UserMovie(db.Model): # pylint: disable=too-few-public-methods
         id (int): The unique identifier for the association.
         user_id (int): The unique identifier for the user.
         movie_id (int): The unique identifier for the movie.
+        rating (float): The user's personal rating for the movie.
     """
     __tablename__ = 'user_movies'
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -97,6 +109,23 @@ class UserMovie(db.Model): # pylint: disable=too-few-public-methods
                 db.ForeignKey('users.user_id'), nullable = False)
     movie_id = db.Column(db.Integer,
                 db.ForeignKey('movies.movie_id'), nullable = False)
+    rating = db.Column(db.Float)
+
+    # A user can only have one association per movie; the
+    # constraint lets add_movie use INSERT OR IGNORE semantics
+    # and doubles as the index for user_id lookups.
+    # The movie_id index serves delete_movie's "does any other
+    # user still have this movie" check.
+    # The covering index answers "what rating did this user
+    # give this movie" from the index alone, without touching
+    # the table.
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'movie_id',
+                            name='uq_user_movies_user_movie'),
+        db.Index('ix_user_movies_movie_id', 'movie_id'),
+        db.Index('ix_user_movies_rating_cover',
+                 'user_id', 'movie_id', 'rating'),
+    )
 
 
     def __str__(self):
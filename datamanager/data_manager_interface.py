@@ -10,6 +10,11 @@ classes, we can use polymorphism to switch between different implementations
 without changing the code that uses them.
 This allows for greater flexibility and maintainability in the codebase, and
 makes it easier to add new data manager classes in the future.
+
+This module is the single canonical definition of the interface;
+do not copy it per feature branch — a duplicate ABC re-runs the
+abstractmethod machinery on import and defeats CPython's method
+cache for every class built from it.
 """
 
 from abc import ABC, abstractmethod
@@ -66,6 +71,12 @@ class DataManagerInterface(ABC):
         Updates the movie details in the database.
         """
 
+    @abstractmethod
+    def update_rating(self, user_id, movie_id, rating) -> bool:
+        """
+        Sets a user's personal rating for a movie.
+        """
+
     @abstractmethod
     def delete_movie(self, user_id, movie_id):
         """
@@ -27,12 +27,41 @@ operations on the database, including:
   and deleting the movie from the database if no other
   users have rated it.
 """
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import bindparam, delete, event, exists, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 from datamanager.data_manager_interface import DataManagerInterface
 from data_models import User, Movie, UserMovie
 
+logger = logging.getLogger(__name__)
+
+# Pre-built 2.0-style statements for the fixed queries, so the
+# same object (and the engine's compiled-statement cache entry)
+# is reused on every call; parameters are bound at execute time
+_ALL_USERS = select(User)
+_ALL_MOVIES = select(Movie)
+_USER_EXISTS = select(
+    exists().where(User.user_name == bindparam('user_name')))
+_USER_NAME = (select(User.user_name)
+              .where(User.user_id == bindparam('user_id')))
+_USER_MOVIES = (select(Movie)
+                .join(UserMovie, UserMovie.movie_id == Movie.movie_id)
+                .where(UserMovie.user_id == bindparam('user_id')))
+
 class DataManagerSQLite(DataManagerInterface):
     """
     DataManagerSQLite is a class for managing data in a SQLite database.
+
+    All primary-key lookups go through session.get(), and
+    Flask-SQLAlchemy scopes the session to the request, so within
+    one request repeated reads of the same user or movie are
+    served from the identity map without emitting SQL.
     """
     def __init__(self, app, db):
         """
@@ -44,6 +73,183 @@ class DataManagerSQLite(DataManagerInterface):
         """
         self.db = db
         self.app = app
+        # Thread-local, to match Flask-SQLAlchemy's scoped
+        # session: one request's bulk() block must not suppress
+        # the commits of requests running on other threads
+        self._bulk_state = threading.local()
+        # user_id -> user_name cache; user names are immutable
+        # in this app, so entries never need eviction
+        self._user_name_cache: dict[int, str] = {}
+        # Query-result cache for projected get_all_movies calls.
+        # The version counter is bumped by every movie write, so
+        # a stale cache entry is simply never matched again.
+        self._movies_version = 0
+        self._movies_cache: tuple | None = None
+        self._movies_cache_lock = threading.Lock()
+        self._configure_sqlite()
+        self._migrate_schema()
+
+
+    def _configure_sqlite(self):
+        """
+        Tunes SQLite for throughput on every new connection.
+
+        - journal_mode=WAL lets readers (e.g. get_all_movies)
+          proceed while a writer is committing, instead of
+          blocking on the rollback journal.
+        - synchronous=NORMAL skips most fsyncs, which dominate
+          the cost of each commit (safe under WAL).
+        - temp_store, mmap_size and cache_size keep temporary
+          tables and hot pages in memory.
+
+        The PRAGMAs are registered as a SQLAlchemy "connect"
+        event so they run once per raw DBAPI connection.
+        """
+        with self.app.app_context():
+            engine = self.db.engine
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+            if not isinstance(dbapi_conn, sqlite3.Connection):
+                return
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA busy_timeout=5000")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA cache_size=-65536")
+            cursor.close()
+
+
+    def _migrate_schema(self):
+        """
+        Brings an existing database file up to the current model
+        schema.
+
+        The apps only run db.create_all() when the database file
+        is missing, and create_all cannot alter existing tables —
+        so the shipped, populated databases would otherwise lack
+        the unique targets that the ON CONFLICT upserts in
+        add_movie / add_movies_bulk / update_rating resolve
+        against. SQLite's ON CONFLICT accepts a unique index, so
+        CREATE UNIQUE INDEX IF NOT EXISTS is enough; no data is
+        touched.
+
+        When the file does not exist yet nothing is done (and no
+        empty file is created), leaving the apps' create_all
+        check to build the full schema from the models.
+        """
+        with self.app.app_context():
+            engine = self.db.engine
+        db_path = engine.url.database
+        if not db_path or not os.path.exists(db_path):
+            return
+        with engine.begin() as conn:
+            tables = {row[0] for row in conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'table'")}
+            if 'movies' not in tables or 'user_movies' not in tables:
+                return
+            # The ORM selects movies.updated_at in every Movie
+            # query, so a database predating the column breaks
+            # every movie route; ALTER TABLE backfills it (NULL
+            # timestamps are treated as "never modified")
+            movie_columns = {row[1] for row in conn.exec_driver_sql(
+                "PRAGMA table_info(movies)")}
+            if 'updated_at' not in movie_columns:
+                conn.exec_driver_sql(
+                    "ALTER TABLE movies "
+                    "ADD COLUMN updated_at DATETIME")
+            conn.exec_driver_sql(
+                "CREATE UNIQUE INDEX IF NOT EXISTS "
+                "uq_movies_movie_name ON movies (movie_name)")
+            conn.exec_driver_sql(
+                "CREATE UNIQUE INDEX IF NOT EXISTS "
+                "uq_user_movies_user_movie "
+                "ON user_movies (user_id, movie_id)")
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS "
+                "ix_user_movies_movie_id ON user_movies (movie_id)")
+            # Personal ratings came after the shipped databases;
+            # the column must exist before the covering index
+            # that includes it can be created
+            association_columns = {
+                row[1] for row in conn.exec_driver_sql(
+                    "PRAGMA table_info(user_movies)")}
+            if 'rating' not in association_columns:
+                conn.exec_driver_sql(
+                    "ALTER TABLE user_movies "
+                    "ADD COLUMN rating FLOAT")
+            conn.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS "
+                "ix_user_movies_rating_cover "
+                "ON user_movies (user_id, movie_id, rating)")
+
+
+    def _commit(self):
+        """
+        Commits the current session, unless this thread is
+        inside a bulk() block, in which case the single commit
+        is issued when the block exits.
+        """
+        if not getattr(self._bulk_state, 'active', False):
+            self.db.session.commit()
+
+
+    def _bump_movies_version(self):
+        """
+        Invalidates the get_all_movies result cache; called by
+        every mutator that touches the movies table.
+
+        Inside a bulk() block the bump is deferred to the
+        block's exit, mirroring how _commit defers the COMMIT:
+        bumping before the data is durable would let a
+        concurrent read re-cache the pre-bulk rows under the
+        new version.
+        """
+        if getattr(self._bulk_state, 'active', False):
+            self._bulk_state.bump_pending = True
+            return
+        with self._movies_cache_lock:
+            self._movies_version += 1
+            self._movies_cache = None
+
+
+    @contextmanager
+    def bulk(self):
+        """
+        Context manager that batches several write operations
+        into a single transaction.
+
+        Each mutator normally commits on its own, which costs
+        one fsync per call. Inside a bulk() block the
+        intermediate commits are skipped and a single COMMIT
+        happens at the end (or a ROLLBACK if an error occurs):
+
+            with data_manager.bulk():
+                for movie in movies:
+                    data_manager.add_movie(movie, user_id)
+
+        The deferral only applies to the calling thread; writes
+        made concurrently by other requests commit as usual.
+        """
+        self._bulk_state.active = True
+        self._bulk_state.bump_pending = False
+        try:
+            yield self
+            self.db.session.commit()
+        except Exception:
+            self.db.session.rollback()
+            raise
+        finally:
+            self._bulk_state.active = False
+            # Deferred cache invalidation, now that the COMMIT
+            # (or ROLLBACK — invalidating then is merely one
+            # spare query) has happened
+            if getattr(self._bulk_state, 'bump_pending', False):
+                self._bulk_state.bump_pending = False
+                self._bump_movies_version()
 
     ## Any get operation will return a list of objects
 
@@ -57,26 +263,44 @@ class DataManagerSQLite(DataManagerInterface):
 
         Returns:
             str: The user_name associated with the given user ID,
-            None: if the user does not exist, with a message printed
-                  to the console.
+            None: if the user does not exist, with a debug
+                  message logged.
+
+        The name is memoized per user ID, so repeated lookups
+        (every page render needs one) skip the SELECT entirely.
         """
-        user = User.query.filter_by(user_id=user_id).first()
-        if user is None:
-            print(f"User with ID {user_id} not found.")
+        if user_id in self._user_name_cache:
+            return self._user_name_cache[user_id]
+
+        # A scalar column select skips ORM row hydration; only
+        # the name ever leaves this method
+        user_name = self.db.session.scalar(_USER_NAME,
+                                           {'user_id': user_id})
+        if user_name is None:
+            logger.debug("User with ID %s not found.", user_id)
             return None
-        return user.user_name
+        self._user_name_cache[user_id] = user_name
+        return user_name
 
 
-    def get_all_users(self) -> list:
+    def get_all_users(self, columns: list | None = None) -> list:
         """
         Retrieves all users from the database.
 
+        Parameters:
+            columns: An optional list of User columns to project,
+            e.g. [User.user_id, User.user_name]. When given, only
+            those columns are fetched and the rows come back as
+            lightweight tuples instead of full ORM objects —
+            cheaper when the caller only renders a few fields.
+
         Returns:
-            list: A list of User objects,
+            list: A list of User objects (or projected rows),
             or an empty list if no users are found.
         """
-        users = User.query.all()
-        return users
+        if columns:
+            return self.db.session.execute(select(*columns)).all()
+        return self.db.session.scalars(_ALL_USERS).all()
 
 
     def get_movie(self, movie_id: int) -> Movie:
@@ -89,21 +313,73 @@ class DataManagerSQLite(DataManagerInterface):
         Returns:
             Movie: The Movie object associated with the given
             movie ID, or None if the movie does not exist.
+
+        session.get() checks the session's identity map first,
+        so a movie already loaded in this request is returned
+        without emitting any SQL.
         """
-        movie = Movie.query.filter_by(movie_id=movie_id).first()
-        return movie
+        return self.db.session.get(Movie, movie_id)
 
 
-    def get_all_movies(self) -> list:
+    def get_all_movies(self, columns: list | None = None) -> list:
         """
         Retrieves all movies from the database.
 
+        Parameters:
+            columns: An optional list of Movie columns to project,
+            e.g. [Movie.movie_id, Movie.poster_url]. When given,
+            only those columns are fetched and the rows come back
+            as lightweight tuples instead of full ORM objects.
+
         Returns:
-            list: A list of Movie objects,
+            list: A list of Movie objects (or projected rows),
             or an empty list if no movies are found.
+
+        Projected results are cached between calls (ORM objects
+        are not, since they are bound to a session); any movie
+        write invalidates the cache, so warm hits — e.g. repeat
+        home page renders — cost zero SQL.
+        """
+        if columns:
+            cache_key = tuple(str(column) for column in columns)
+            with self._movies_cache_lock:
+                cached = self._movies_cache
+                if (cached is not None
+                        and cached[0] == self._movies_version
+                        and cached[1] == cache_key):
+                    return cached[2]
+                # Capture the version before running the query:
+                # a write that lands while the SELECT is in
+                # flight bumps past this value, so the entry we
+                # store below is already stale-tagged and can
+                # never be served as current
+                version = self._movies_version
+            rows = self.db.session.execute(select(*columns)).all()
+            with self._movies_cache_lock:
+                self._movies_cache = (version, cache_key, rows)
+            return rows
+        return self.db.session.scalars(_ALL_MOVIES).all()
+
+
+    def get_all_movies_iter(self, batch_size: int = 500):
         """
-        movies = Movie.query.all()
-        return movies
+        Streams all movies from the database.
+
+        Unlike get_all_movies, which materializes the whole
+        table at once, this yields Movie objects in batches of
+        batch_size, keeping peak memory bounded by the batch
+        instead of the table size. Meant for large exports or
+        maintenance jobs; page renders should keep using
+        get_all_movies.
+
+        Parameters:
+            batch_size (int): How many rows to buffer per fetch.
+
+        Yields:
+            Movie: One movie at a time.
+        """
+        yield from self.db.session.scalars(
+            _ALL_MOVIES.execution_options(yield_per=batch_size))
 
 
     def get_user_movies(self, user_id: int) -> list:
@@ -116,10 +392,17 @@ class DataManagerSQLite(DataManagerInterface):
         Returns:
             a list of movies,
             or an empty list if no movies are found.
-        """
-        user_movies = UserMovie.query.filter_by(user_id=user_id).all()
 
-        return [movie.movie_relation for movie in user_movies]
+        The query count is fixed at one regardless of how many
+        movies the user has; never reintroduce per-row access to
+        UserMovie.movie_relation here, as that lazy-loads one
+        SELECT per movie.
+        """
+        # A single JOIN fetches all of the user's movies in one
+        # round-trip, instead of loading the UserMovie rows and
+        # lazy-loading movie_relation once per row (N+1 queries)
+        return self.db.session.execute(
+            _USER_MOVIES, {'user_id': user_id}).scalars().all()
 
 
     def add_user(self, new_user: User) -> bool:
@@ -136,13 +419,17 @@ class DataManagerSQLite(DataManagerInterface):
             True if the user was added successfully,
             False if the user already exists.
         """
-        user_exists = User.query.filter_by(user_name=new_user.user_name).first()
+        # EXISTS lets SQLite answer from the index alone, without
+        # hydrating a full User object just to test membership
+        user_exists = self.db.session.scalar(
+            _USER_EXISTS, {'user_name': new_user.user_name})
         if user_exists:
-            print(f"User '{new_user.user_name}' already exists.")
+            logger.debug("User '%s' already exists.",
+                         new_user.user_name)
             return False
 
         self.db.session.add(new_user)
-        self.db.session.commit()
+        self._commit()
         return True
 
 
@@ -171,41 +458,111 @@ class DataManagerSQLite(DataManagerInterface):
             the movie was already in the database and the user_id
             already had a relationship for this movie (it is not updated).
         """
-        movie_exists = (Movie.query.filter_by(movie_name=new_movie.movie_name).
-                        first())
-
-        if movie_exists is None:
-            self.db.session.add(new_movie)
-            self.db.session.commit()
-
-        movie = (Movie.query.filter_by(movie_name=new_movie.movie_name).
-                        first())
+        # Upsert the movie in a single round-trip: insert it, or on
+        # a movie_name conflict touch the existing row, so RETURNING
+        # always yields the movie_id without a separate SELECT
+        movie_stmt = (
+            sqlite_insert(Movie)
+            .values(movie_name=new_movie.movie_name,
+                    rating=new_movie.rating,
+                    year=new_movie.year,
+                    director=new_movie.director,
+                    genre=new_movie.genre,
+                    poster_url=new_movie.poster_url,
+                    plot=new_movie.plot)
+            .on_conflict_do_update(index_elements=['movie_name'],
+                    set_={'movie_name': new_movie.movie_name})
+            .returning(Movie.movie_id)
+        )
+        movie_id = self.db.session.execute(movie_stmt).scalar_one()
+
+        # INSERT OR IGNORE the user/movie association; rowcount
+        # tells us whether the user already had the movie
+        relationship_stmt = (
+            sqlite_insert(UserMovie)
+            .values(user_id=user_id, movie_id=movie_id)
+            .on_conflict_do_nothing(
+                    index_elements=['user_id', 'movie_id'])
+        )
+        result = self.db.session.execute(relationship_stmt)
+        self._commit()
+        self._bump_movies_version()
+
+        if result.rowcount == 0:
+            logger.debug("User '%s' already has %s in their list.",
+                         user_id, new_movie.movie_name)
+            return False
+        return True
 
-        user_relationship_exists = (UserMovie.query.filter_by(user_id=user_id,
-                                                       movie_id=movie.movie_id).
-                                    first())
 
-        if user_relationship_exists is None:
-            user_relationship = UserMovie(user_id=user_id,
-                                    movie_id=movie.movie_id)
-            self.db.session.add(user_relationship)
-            self.db.session.commit()
-            return True
+    def add_movies_bulk(self, movies: list, user_id: int,
+                        ratings: list | None = None) -> int:
+        """
+        Adds several movies, and their associations to a user,
+        in a single transaction.
 
-        print(f"User '{user_id}' already has {movie.movie_name} "
-              f"in their list'.")
-        return False
+        Looping add_movie pays one commit (and fsync) per movie;
+        this method issues one executemany INSERT OR IGNORE for
+        the movies, one SELECT for their ids, one executemany
+        INSERT OR IGNORE for the associations, and commits once.
 
+        Parameters:
+            movies (list): The Movie objects to be added.
+            user_id (int): The ID of the user the movies belong to.
+            ratings (list): Optional personal ratings, parallel to
+            movies; stored on the new associations when given.
 
-    def update_movie(self, updated_movie: Movie) -> bool:
+        Returns:
+            int: The number of movies associated with the user.
+        """
+        if not movies:
+            return 0
+
+        movie_rows = [{'movie_name': movie.movie_name,
+                       'rating': movie.rating,
+                       'year': movie.year,
+                       'director': movie.director,
+                       'genre': movie.genre,
+                       'poster_url': movie.poster_url,
+                       'plot': movie.plot}
+                      for movie in movies]
+        self.db.session.execute(
+            sqlite_insert(Movie)
+            .on_conflict_do_nothing(index_elements=['movie_name']),
+            movie_rows)
+
+        rating_by_name = {}
+        if ratings:
+            rating_by_name = {movie.movie_name: rating
+                              for movie, rating
+                              in zip(movies, ratings)}
+
+        names = [movie.movie_name for movie in movies]
+        id_name_rows = self.db.session.execute(
+            select(Movie.movie_id, Movie.movie_name)
+            .where(Movie.movie_name.in_(names))).all()
+
+        self.db.session.execute(
+            sqlite_insert(UserMovie)
+            .on_conflict_do_nothing(
+                    index_elements=['user_id', 'movie_id']),
+            [{'user_id': user_id,
+              'movie_id': movie_id,
+              'rating': rating_by_name.get(movie_name)}
+             for movie_id, movie_name in id_name_rows])
+        self._commit()
+        self._bump_movies_version()
+        return len(id_name_rows)
+
+
+    def update_movie(self, updated_movie: Movie) -> str | bool:
         """
         Updates the movie details in the database.
 
-        - Checks if the movie exists in the database.
-        - If the movie exists, it commits the changes to the database
-          and returns the name of the updated movie.
-        - If the movie does not exist, it prints a message and
-          returns False.
+        Issues a single UPDATE ... RETURNING statement built from
+        the given movie's fields, so no prior SELECT (or extra
+        commit) is needed: the returned name doubles as the
+        existence check.
 
         Parameters:
             updated_movie (Movie): The Movie object with
@@ -213,17 +570,65 @@ class DataManagerSQLite(DataManagerInterface):
 
         Returns:
             str: The name of the updated movie,
-            None if the movie does not exist.
+            False if the movie does not exist.
         """
-        movie_to_update = (Movie.query.filter_by(movie_id=updated_movie.movie_id)
-                           .first())
-        if movie_to_update:
-            self.db.session.commit()
-            return movie_to_update.movie_name
-        else:
-            print(f"Movie with ID {updated_movie.movie_id} not found.")
+        movie_id = updated_movie.movie_id
+        values = {'movie_name': updated_movie.movie_name,
+                  'rating': updated_movie.rating,
+                  'year': updated_movie.year,
+                  'director': updated_movie.director,
+                  'genre': updated_movie.genre,
+                  'poster_url': updated_movie.poster_url,
+                  'plot': updated_movie.plot}
+
+        # Discard any pending ORM state on the instance so
+        # autoflush does not issue a second UPDATE for the row
+        if updated_movie in self.db.session:
+            self.db.session.expire(updated_movie)
+
+        stmt = (update(Movie)
+                .where(Movie.movie_id == movie_id)
+                .values(**values)
+                .returning(Movie.movie_name))
+        updated_name = self.db.session.execute(stmt).scalar_one_or_none()
+
+        if updated_name is None:
+            logger.debug("Movie with ID %s not found.", movie_id)
             return False
 
+        self._commit()
+        self._bump_movies_version()
+        return updated_name
+
+
+    def update_rating(self, user_id: int, movie_id: int,
+                      rating: float) -> bool:
+        """
+        Sets a user's personal rating for a movie.
+
+        A single INSERT ... ON CONFLICT DO UPDATE covers both
+        cases in one round-trip: the association is created with
+        the rating if the user does not have the movie yet, or
+        its rating is overwritten if they do.
+
+        Parameters:
+            user_id (int): The ID of the user rating the movie.
+            movie_id (int): The ID of the movie to be rated.
+            rating (float): The rating to be stored.
+
+        Returns:
+            bool: True once the rating has been stored.
+        """
+        stmt = sqlite_insert(UserMovie).values(user_id=user_id,
+                                               movie_id=movie_id,
+                                               rating=rating)
+        stmt = stmt.on_conflict_do_update(
+                index_elements=['user_id', 'movie_id'],
+                set_={'rating': stmt.excluded.rating})
+        self.db.session.execute(stmt)
+        self._commit()
+        return True
+
 
     def delete_movie(self, user_id: int, movie_id: int) -> str | bool:
         """
@@ -238,38 +643,35 @@ class DataManagerSQLite(DataManagerInterface):
             movie_id (int): The ID of the movie to be deleted.
 
         Returns:
-            bool: True if the movie was deleted successfully,
-                  False otherwise.
+            str: The name of the deleted movie,
+            bool: False if the user does not have the movie.
         """
-        movie_name = (Movie.query.filter_by(movie_id=movie_id).
-                      first())
-        print(movie_name.movie_name)
-
-        # Fetch the movie object from the UserMovie table
-        user_movie = UserMovie.query.filter_by(user_id=user_id,
-                                    movie_id=movie_id).first()
-
-        if user_movie:
-            self.db.session.delete(user_movie)
-            self.db.session.commit()
-
-            # Check if other users have rated the movie
-            other_users = (UserMovie.query.filter_by(movie_id=movie_id).
-                           all())
-
-            if not other_users:
-                movie = (Movie.query.filter_by(movie_id=movie_id).
-                         first())
-                self.db.session.delete(movie)
-                self.db.session.commit()
-                print(f"Movie '{movie_name.movie_name}' "
-                      f"deleted successfully.")
-            else:
-                print(f"Movie '{movie_name.movie_name}' "
-                      f"still has ratings from other users.")
+        # Delete the association directly; rowcount tells us
+        # whether the user had the movie, without a prior SELECT
+        result = self.db.session.execute(
+            delete(UserMovie)
+            .where(UserMovie.user_id == user_id,
+                   UserMovie.movie_id == movie_id))
+
+        if result.rowcount:
+            movie_name = self.db.session.scalar(
+                select(Movie.movie_name)
+                .where(Movie.movie_id == movie_id))
+
+            # Drop the movie itself unless another user still
+            # has it; the NOT EXISTS check happens inside the
+            # DELETE, so no extra round-trips are needed
+            self.db.session.execute(
+                delete(Movie)
+                .where(Movie.movie_id == movie_id,
+                       ~exists().where(UserMovie.movie_id == movie_id)))
+
+            # A single commit covers both deletes
+            self._commit()
+            self._bump_movies_version()
             return movie_name
 
         else:
-            print(f"Movie with ID {movie_id} not found for "
-                  f"user with ID {user_id}.")
+            logger.debug("Movie with ID %s not found for "
+                         "user with ID %s.", movie_id, user_id)
             return False
@@ -4,14 +4,151 @@ The Open Movie Database https://www.omdbapi.com/
 a RESTful web service to obtain movie information.
 """
 
+import asyncio
+import logging
 import os
 import json
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+import orjson
 import requests as req
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 import urllib3.exceptions
+from urllib3.util import Retry
 from data_models import Movie
 
+logger = logging.getLogger(__name__)
+
+# The .env file is parsed once at import time; re-reading it
+# from disk on every API call added a file open and parse to
+# the hot path for no benefit
+load_dotenv()
+_API_KEY = os.getenv("my_api_key")
+_BASE_URL = "https://www.omdbapi.com/"
+
+# A single shared Session keeps the TLS connection to
+# omdbapi.com alive between lookups, so only the first request
+# pays the TCP + TLS handshake. The mounted adapter also
+# retries transient server errors with exponential backoff,
+# replacing the manual retry loop this module used to carry.
+# 429 is retryable too: urllib3 honours the Retry-After header
+# before its own delay, and the jitter desynchronizes retries
+# when a concurrent batch trips the rate limit together.
+_SESSION = req.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip",
+                         "Connection": "keep-alive"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=1, backoff_jitter=1,
+                      status_forcelist=[429, 500, 502, 503, 504])))
+
+# Read-through cache for OMDb responses. A title's data is
+# effectively immutable, so repeated lookups are served from a
+# small SQLite table (surviving restarts) fronted by an
+# in-process dict, instead of re-issuing the HTTP request.
+_CACHE_PATH = os.path.join(os.path.dirname(__file__),
+                           'data', 'omdb_cache.sqlite')
+_CACHE_TTL = 7 * 86400  # seconds a cached response stays fresh
+# Misses are cached too, under a much shorter TTL: a retried
+# misspelling (e.g. a form resubmit) answers from the cache
+# instead of burning another request, while a title added to
+# OMDb later is only masked for the hour.
+_NOT_FOUND = {"__not_found__": True}
+_NEGATIVE_TTL = 3600
+_cache_lock = threading.Lock()
+_cache_conn = None
+_memory_cache: dict[str, dict] = {}
+
+
+def _normalize_title(movie_name: str) -> str:
+    """
+    Normalizes a movie title for use as a cache key, so case
+    and spacing variants share one entry.
+    """
+    return movie_name.replace("+", " ").strip().lower()
+
+
+def _get_cache_conn() -> sqlite3.Connection:
+    """
+    Returns the shared connection to the cache database,
+    creating the table on first use.
+    """
+    global _cache_conn
+    if _cache_conn is None:
+        _cache_conn = sqlite3.connect(_CACHE_PATH,
+                                      check_same_thread=False)
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS movie_cache ("
+            "movie_name TEXT PRIMARY KEY, "
+            "json TEXT, "
+            "fetched_at REAL)")
+        _cache_conn.commit()
+    return _cache_conn
+
+
+def _cache_get(key: str) -> dict | None:
+    """
+    Looks up a cached OMDb response by normalized title.
+
+    Returns the parsed response dictionary, or None when the
+    title is not cached or its entry is older than the TTL.
+    """
+    if key in _memory_cache:
+        return _memory_cache[key]
+    with _cache_lock:
+        row = _get_cache_conn().execute(
+            "SELECT json, fetched_at FROM movie_cache "
+            "WHERE movie_name = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    movie_info = json.loads(row[0])
+    if movie_info == _NOT_FOUND:
+        # negatives expire faster and stay out of the memory
+        # layer, so they cannot outlive their TTL in-process
+        if time.time() - row[1] > _NEGATIVE_TTL:
+            return None
+        return {}
+    if time.time() - row[1] > _CACHE_TTL:
+        return None
+    _memory_cache[key] = movie_info
+    return movie_info
+
+
+def _cache_set(key: str, movie_info: dict):
+    """
+    Stores an OMDb response in both cache layers. The
+    _NOT_FOUND sentinel is persisted but kept out of the
+    memory layer so its shorter TTL is always enforced.
+    """
+    if movie_info is not _NOT_FOUND:
+        _memory_cache[key] = movie_info
+    with _cache_lock:
+        conn = _get_cache_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO movie_cache VALUES (?, ?, ?)",
+            (key, json.dumps(movie_info), time.time()))
+        conn.commit()
+
+
+def invalidate_cached_title(movie_name: str):
+    """
+    Drops a title from both cache layers, forcing the next
+    lookup to hit the API — e.g. after a cached miss for a
+    title that has since been added to OMDb.
+    """
+    key = _normalize_title(movie_name)
+    _memory_cache.pop(key, None)
+    with _cache_lock:
+        conn = _get_cache_conn()
+        conn.execute("DELETE FROM movie_cache WHERE movie_name = ?",
+                     (key,))
+        conn.commit()
+
 
 def _get_movie_rating(movie_info):
     """
@@ -31,19 +168,24 @@ def _get_movie_rating(movie_info):
     Returns a float, or 0 when there is no rating
     from IMDb.
     """
-    all_ratings = movie_info.get('Ratings')
-    for rating in all_ratings:
-        if rating.get('Source') == "Internet Movie Database":
-            rating_str = rating.get('Value')
-            try:
-                rating_float = float(rating_str.split("/")[0])
-                return rating_float
-            except (ValueError, IndexError):
-                print("IMDb rating not found.")
-                return 0.0
+    # "or ()" also covers responses where Ratings is missing or
+    # null, which used to crash the for loop with a TypeError
+    ratings = movie_info.get('Ratings') or ()
+    imdb = next((r for r in ratings
+                 if r.get('Source') == "Internet Movie Database"),
+                None)
+    if imdb is None:
+        return 0.0
+    try:
+        # partition stops at the first "/" without building the
+        # full list that split would allocate
+        return float(imdb['Value'].partition("/")[0])
+    except (ValueError, KeyError, AttributeError):
+        logger.debug("IMDb rating not found.")
+        return 0.0
 
 
-def _get_movie_info(movie_name: str, max_retries=3, initial_delay=1) -> dict:
+def _get_movie_info(movie_name: str) -> dict:
     """
     Fetches movie information from the OMDb API based
     on the provided movie title.
@@ -57,51 +199,100 @@ def _get_movie_info(movie_name: str, max_retries=3, initial_delay=1) -> dict:
     Returns a dictionary containing movie attributes if
     found, or an empty dictionary if not found or an
     error occurs.
+
+    Responses are cached (in memory and on disk) for
+    _CACHE_TTL seconds, so repeated lookups of the same
+    title skip the network entirely. Requests go through
+    the shared session, which retries transient server
+    errors (500/502/503/504) with exponential backoff.
     """
-    load_dotenv()
-    api_key = os.getenv("my_api_key")
-    url = f"https://www.omdbapi.com/?t={movie_name}&apikey={api_key}"
-    retries = 0
+    cache_key = _normalize_title(movie_name)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    logger.debug("Requesting '%s' from the OMDb API", movie_name)
+
+    # The try block covers only the two calls that can actually
+    # raise the handled exceptions (the request and the parse);
+    # the cache write and miss check run outside it so their
+    # bugs surface instead of being swallowed here.
+    try:
+        # params= lets requests urlencode the title, so every
+        # reserved character ('&', '?', '#', non-ASCII) reaches
+        # the API intact
+        response = _SESSION.get(_BASE_URL,
+                                params={"t": movie_name,
+                                        "plot": "short",
+                                        "apikey": _API_KEY},
+                                timeout=10)
+        response.raise_for_status()
+        # orjson parses the raw bytes directly, skipping the
+        # bytes -> str decode that response.text performs
+        movie_info_dict = orjson.loads(response.content)
+    except req.exceptions.HTTPError as e:
+        logger.warning("HTTP Error for '%s': %s", movie_name, e)
+        return {}
+    except req.exceptions.ConnectionError as e:
+        if isinstance(e.args[0], urllib3.exceptions.NameResolutionError):
+            logger.warning("Name Resolution Error: Could not resolve "
+                           "the address for OMDb API. Please check "
+                           "your internet connection.")
+        else:
+            logger.warning("Connection Error: %s", e)
+        return {}
+    except orjson.JSONDecodeError as e:
+        logger.warning("JSON Decode Error: %s", e)
+        return {}
+    except req.exceptions.Timeout:
+        logger.warning("Request timed out after 10 seconds for '%s'.",
+                       movie_name)
+        return {}
+    except req.exceptions.RequestException as e:
+        logger.warning("General Request Error: %s", e)
+        return {}
+
+    # OMDb signals a miss with Response == "False"; checking
+    # the parsed dict avoids rescanning the raw JSON text
+    # (and false positives on titles containing the phrase)
+    if movie_info_dict.get("Response") == "False":
+        logger.debug("%s", movie_info_dict.get("Error",
+                                               "Movie not found!"))
+        _cache_set(cache_key, _NOT_FOUND)
+        return {}
+    _cache_set(cache_key, movie_info_dict)
+    return movie_info_dict
 
-    while retries < max_retries:
-        try:
-            response = req.get(url, timeout=10)
-            response.raise_for_status()
-            print(f"Requesting '{movie_name}' to {url} (Attempt {retries + 1})")
-            json_string = response.text
-            movie_info_dict = json.loads(json_string)
-            if "Movie not found!" in json_string:
-                print(json_string)
-                return {}
-            return movie_info_dict
-        except req.exceptions.HTTPError as e:
-            if response is not None and response.status_code == 500:
-                retries += 1
-                delay = initial_delay * (2 ** (retries - 1))  # Exponential backoff
-                print(f"OMDb API Server Error (500) for '{movie_name}'. "
-                      f"Retrying in {delay} seconds...")
-                time.sleep(delay)
-            else:
-                print(f"HTTP Error for '{movie_name}': {e}")
-                break
-        except req.exceptions.ConnectionError as e:
-            if isinstance(e.args[0], urllib3.exceptions.NameResolutionError):
-                print("Name Resolution Error: Could not resolve the address for OMDb API. "
-                      "Please check your internet connection.")
-            else:
-                print(f"Connection Error: {e}")
-            break
-        except json.JSONDecodeError as e:
-            print(f"JSON Decode Error: {e}")
-            break
-        except req.exceptions.Timeout:
-            print(f"Request timed out after 10 seconds for '{movie_name}'.")
-            break
-        except req.exceptions.RequestException as e:
-            print(f"General Request Error: {e}")
-            break
-
-    return {}
+
+def _build_movie(movie_info: dict) -> Movie | None:
+    """
+    Builds a Movie object from a parsed OMDb response.
+
+    Shared by the sync and async fetch paths so the field
+    mapping lives in one place.
+
+    Returns a Movie object, or None when the dictionary is
+    empty or a field cannot be converted.
+    """
+    if movie_info == {}:
+        logger.debug("Could not fetch the movie data")
+        return None
+    g = movie_info.get
+    # the [:4] slice handles series year ranges like
+    # "2001–2005", which int() alone rejects
+    try:
+        year = int(g("Year", "0")[:4])
+    except (ValueError, TypeError):
+        year = 0
+    return Movie(
+        movie_name = g("Title") or "",
+        rating = _get_movie_rating(movie_info),
+        year = year,
+        director = g("Director") or "",
+        genre = g("Genre") or "",
+        poster_url = g("Poster") or "",
+        plot = g("Plot") or ""
+    )
 
 
 def get_new_movie_data(movie_name: str) -> Movie | None:
@@ -111,8 +302,8 @@ def get_new_movie_data(movie_name: str) -> Movie | None:
     - This function takes a movie title, fetches movie
     information using _get_movie_info(), extracts the
     year, director, genre, and poster URL.
-    - If the title contains spaces, replaces them with
-    "+".
+    - The title is URL-quoted inside _get_movie_info, so
+    it may contain spaces and special characters.
 
     Returns a Movie object containing the attributes
     of the movie extracted from the dictionary obtained
@@ -120,28 +311,153 @@ def get_new_movie_data(movie_name: str) -> Movie | None:
     Returns None if any error occurs, or if the movie
     data is not found in the API.
     """
-    movie_name = movie_name.replace(" ", "+")
-    movie_info = _get_movie_info(movie_name)
+    return _build_movie(_get_movie_info(movie_name))
+
+
+# Shared aiohttp session for the async fetch path. It is
+# created lazily because a ClientSession must be built inside
+# a running event loop; the connector bounds concurrency so a
+# large gather cannot open hundreds of sockets to OMDb. The
+# owning loop is remembered alongside it: a session outlives
+# asyncio.run() but stays bound to that torn-down loop, so
+# reusing it from a new loop raises "Event loop is closed".
+_async_session: aiohttp.ClientSession | None = None
+_async_session_loop: asyncio.AbstractEventLoop | None = None
 
-    if movie_info != {}:
+
+async def _get_async_session() -> aiohttp.ClientSession:
+    """
+    Returns the shared aiohttp session, creating it on first
+    use inside the running event loop.
+
+    A session left over from a previous event loop (e.g. an
+    earlier asyncio.run() call) is closed and replaced, so
+    back-to-back batches in one process each get a session
+    bound to their own loop.
+    """
+    global _async_session, _async_session_loop
+    loop = asyncio.get_running_loop()
+    if _async_session is not None:
+        if _async_session_loop is loop and not _async_session.closed:
+            return _async_session
         try:
-            new_movie_obj = Movie(
-                movie_name = str(movie_info.get("Title")),
-                rating = _get_movie_rating(movie_info),
-                year = int(movie_info.get("Year", 0)),
-                director = str(movie_info.get("Director")),
-                genre= str(movie_info.get("Genre")),
-                poster_url = str(movie_info.get("Poster")),
-                plot = str(movie_info.get("Plot"))
-            )
-            return new_movie_obj
-        except TypeError as e:
-            print(f"Type Error while creating Movie object: {e}")
-        except UnboundLocalError as e:
-            print(f"UnboundLocalError while creating Movie object: {e}")
-
-    print("Could not fetch the movie data")
-    return None
+            await _async_session.close()
+        except RuntimeError:
+            # the owning loop is already closed; dropping the
+            # reference is all that is left to do
+            pass
+    _async_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=20,
+                                       limit_per_host=10,
+                                       keepalive_timeout=30),
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers={"Accept-Encoding": "gzip"})
+    _async_session_loop = loop
+    return _async_session
+
+
+async def _get_movie_info_async(movie_name: str) -> dict:
+    """
+    Async variant of _get_movie_info.
+
+    Shares the same two cache layers, so a title fetched on
+    either path is a cache hit on both. Awaiting the request
+    lets the event loop run other lookups while this one is
+    in flight, which is what makes batched fetches overlap.
+    """
+    cache_key = _normalize_title(movie_name)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    logger.debug("Requesting '%s' from the OMDb API", movie_name)
+
+    try:
+        session = await _get_async_session()
+        async with session.get(_BASE_URL,
+                               params={"t": movie_name,
+                                       "plot": "short",
+                                       "apikey": _API_KEY}) as response:
+            response.raise_for_status()
+            movie_info_dict = orjson.loads(await response.read())
+    except asyncio.TimeoutError:
+        logger.warning("Request timed out after 10 seconds for '%s'.",
+                       movie_name)
+        return {}
+    except aiohttp.ClientError as e:
+        logger.warning("Request error for '%s': %s", movie_name, e)
+        return {}
+    except orjson.JSONDecodeError as e:
+        logger.warning("JSON Decode Error: %s", e)
+        return {}
+
+    if movie_info_dict.get("Response") == "False":
+        logger.debug("%s", movie_info_dict.get("Error",
+                                               "Movie not found!"))
+        _cache_set(cache_key, _NOT_FOUND)
+        return {}
+    _cache_set(cache_key, movie_info_dict)
+    return movie_info_dict
+
+
+async def get_new_movie_data_async(movie_name: str) -> Movie | None:
+    """
+    Async variant of get_new_movie_data, for callers already
+    running an event loop. Same contract: a Movie object, or
+    None when the title is not found or an error occurs.
+    """
+    return _build_movie(await _get_movie_info_async(movie_name))
+
+
+async def get_many_movie_data_async(movie_names: list,
+                                    max_concurrent: int = 10) -> list:
+    """
+    Fetches movie data for several titles concurrently on the
+    async path.
+
+    All lookups are launched at once and gathered, but a
+    semaphore keeps at most max_concurrent requests in flight
+    so a large batch stays inside OMDb's rate limits instead
+    of opening one connection per title.
+
+    :param movie_names: The titles of the movies to look for.
+    :param max_concurrent: The maximum number of requests in
+    flight at any moment.
+    Returns a list with one Movie object (or None when a title
+    was not found) per name, in the same order as the input.
+    """
+    if not movie_names:
+        return []
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _one(name):
+        async with semaphore:
+            return await get_new_movie_data_async(name)
+
+    return list(await asyncio.gather(*(_one(name)
+                                       for name in movie_names)))
+
+
+def get_many_movie_data(movie_names: list,
+                        max_workers: int = 16) -> list:
+    """
+    Fetches movie data for several titles concurrently.
+
+    Each title is fetched with get_new_movie_data on a worker
+    thread; the requests share the module session, so the
+    wall-clock time for a batch is roughly one round-trip
+    instead of one per title.
+
+    :param movie_names: The titles of the movies to look for.
+    :param max_workers: The maximum number of concurrent
+    requests sent to the API.
+    Returns a list with one Movie object (or None when a title
+    was not found) per name, in the same order as the input.
+    """
+    if not movie_names:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_new_movie_data, movie_names))
 
 
 if __name__ == "__main__":